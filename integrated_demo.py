@@ -10,24 +10,152 @@ Shows off both agents working together:
 Works with any documentation but designed for MoEngage docs.
 """
 
+import sys
 import time
 import json
+import os
+import gzip
+import hashlib
+from importlib import metadata
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from typing import Dict
+import documentation_analyzer
 from documentation_analyzer import DocumentationAnalyzer
 from revision_agent import DocumentationRevisionAgent
 
-def run_integrated_demo(url: str):
+# orjson is a lot faster at dumping big reports, but it's optional -
+# ujson is the next best thing where orjson has no wheel, and plain json
+# works fine if neither is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+ujson = None
+if orjson is None:
+    try:
+        import ujson
+    except ImportError:
+        pass
+
+def _save_json(path: str, data: Dict, pretty: bool = False):
+    """
+    Writes a report to disk as UTF-8 JSON.
+    
+    Compact by default since these mostly get read by other tools - pass
+    pretty=True for indented output. Paths ending in .gz get gzipped on the way out.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    elif ujson is not None:
+        # ujson escapes every / by default, which makes the URLs unreadable
+        payload = ujson.dumps(data, indent=2 if pretty else 0, ensure_ascii=False,
+                              escape_forward_slashes=False).encode('utf-8')
+    elif pretty:
+        # json.dump() writes token by token, so build the whole thing and write it once
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    else:
+        payload = json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    
+    if path.endswith('.gz'):
+        # Level 1 gets most of the size win on repetitive JSON for very little CPU
+        with gzip.open(path, 'wb', compresslevel=1) as f:
+            f.write(payload)
+    else:
+        with open(path, 'wb') as f:
+            f.write(payload)
+
+def _save_html(path: str, html: str):
+    """Writes the revised article out as UTF-8."""
+    # Straight to bytes, no text-mode wrapper or newline translation in the way
+    with open(path, 'wb') as f:
+        f.write(html.encode('utf-8'))
+
+# Analysis reports from earlier runs live here, so re-running the demo on a
+# page that hasn't changed skips the whole analysis phase
+_CACHE_DIR = '.cache'
+# Bump this whenever the report format changes so old cached reports get ignored
+_CACHE_VERSION = 1
+
+# Packages whose behaviour shows up in the numbers: parsing, sentence
+# splitting and the readability formulas (pyphen does textstat's syllables)
+_ANALYSIS_PACKAGES = ['beautifulsoup4', 'lxml', 'nltk', 'textstat', 'pyphen']
+
+def _analyzer_fingerprint() -> str:
+    """
+    Hash of the analyzer's source code plus the versions of the packages it
+    leans on, so changing the analysis logic or upgrading textstat & co.
+    automatically invalidates cached reports - nobody has to remember to bump anything.
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(documentation_analyzer.__file__, 'rb') as f:
+            digest.update(f.read())
+    except OSError:
+        # Can't read our own source (frozen app?) - the versions will have to do
+        pass
+    for package in _ANALYSIS_PACKAGES:
+        try:
+            package_version = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            package_version = 'missing'
+        digest.update(f"\n{package}=={package_version}".encode('utf-8'))
+    return digest.hexdigest()
+
+_ANALYZER_FINGERPRINT = _analyzer_fingerprint()
+
+def _analysis_cache_path(url: str, html: str) -> str:
+    """Where the cached report for this exact version of the page (and the analyzer) would live."""
+    digest = hashlib.sha256(f"{_CACHE_VERSION}\n{_ANALYZER_FINGERPRINT}\n{url}\n{html}".encode('utf-8')).hexdigest()
+    return os.path.join(_CACHE_DIR, f"{digest}.analysis.json")
+
+def _load_cached_analysis(path: str):
+    """Returns the cached report at path, or None if there isn't a usable one."""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    except (OSError, ValueError):
+        # Not cached yet (or a half-written file) - just analyze again
+        return None
+
+def _save_cached_analysis(path: str, report: Dict):
+    """Caches a report. Writes to a temp file first so readers never see half a file."""
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        _save_json(tmp_path, report)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"WARNING: Couldn't cache the analysis report: {e}")
+
+def run_integrated_demo(url: str, compress: bool = False, pretty: bool = False):
     """
     Run the full demo - analysis plus automated improvements.
     
     Takes a URL, analyzes it, fixes what it can, and spits out
-    detailed reports about what happened.
+    detailed reports about what happened. With compress=True the
+    JSON reports get written gzipped (.json.gz), and pretty=True indents
+    them for reading by hand.
     """
+    report_suffix = '.json.gz' if compress else '.json'
+    analysis_path = f"analysis_report{report_suffix}"
+    revision_path = f"revision_report{report_suffix}"
+    
     print("=" * 80)
     print("DOCUMENTATION IMPROVEMENT AGENT DEMONSTRATION")
     print("=" * 80)
     print(f"Target URL: {url}")
     print("-" * 80)
     
+    # Setting up Agent 2 pings the Ollama server, which can take a few seconds
+    # when it isn't running. None of that depends on the analysis, so get it
+    # going in the background while Agent 1 works. It stays quiet so its
+    # Ollama status lines don't land in the middle of Phase 1's output.
+    executor = ThreadPoolExecutor(max_workers=1)
+    agent_future = executor.submit(DocumentationRevisionAgent, quiet=True)
+    executor.shutdown(wait=False)
+    
     # Phase 1: Let Agent 1 do its thing
     print("\nPHASE 1: COMPREHENSIVE DOCUMENTATION ANALYSIS")
     print("-" * 50)
@@ -35,62 +163,74 @@ def run_integrated_demo(url: str):
     analyzer = DocumentationAnalyzer()
     
     # Grab the article first
-    print("Fetching article content...")
+    print("Fetching article content...", flush=True)
     if not analyzer.fetch_article(url):
         print("FAILED: Unable to fetch article content")
+        # Let the agent's Ollama check finish before we leave, instead of
+        # leaving it running behind our back
+        if not agent_future.cancel():
+            agent_future.exception()
         return
     
     print("SUCCESS: Article fetched successfully")
-    print("Analyzing content across all quality dimensions...")
+    print("Analyzing content across all quality dimensions...", flush=True)
     
     # Time how long analysis takes
-    analysis_start = time.time()
-    analysis_report = analyzer.generate_report()
-    analysis_time = time.time() - analysis_start
-    
-    print(f"SUCCESS: Analysis completed in {analysis_time:.2f} seconds")
+    analysis_start = time.perf_counter()
+    cache_path = _analysis_cache_path(url, analyzer.content)
+    analysis_report = _load_cached_analysis(cache_path)
+    if analysis_report is not None:
+        analysis_time = time.perf_counter() - analysis_start
+        print(f"SUCCESS: Page hasn't changed since the last run, reused its analysis ({analysis_time:.2f} seconds)")
+    else:
+        analysis_report = analyzer.generate_report()
+        analysis_time = time.perf_counter() - analysis_start
+        _save_cached_analysis(cache_path, analysis_report)
+        print(f"SUCCESS: Analysis completed in {analysis_time:.2f} seconds")
     
     # Show what we found
     print("\nANALYSIS SUMMARY:")
     print("-" * 20)
     
+    # The analyzer already tallied the suggestions per dimension
+    suggestion_counts = analysis_report['summary']['sections']
+    total_suggestions = analysis_report['summary']['total_suggestions']
+    
     for dimension in ['readability', 'structure', 'completeness', 'style_guidelines']:
-        section = analysis_report.get(dimension, {})
-        suggestions_count = len(section.get('suggestions', []))
-        print(f"  {dimension.title()}: {suggestions_count} suggestions")
+        print(f"  {dimension.title()}: {suggestion_counts.get(dimension, 0)} suggestions")
     
     print("\nKEY SUGGESTIONS:")
     print("-" * 15)
     
-    # Collect all the suggestions
-    all_suggestions = []
-    for section in analysis_report.values():
-        if isinstance(section, dict) and 'suggestions' in section:
-            all_suggestions.extend(section['suggestions'])
-    
-    # Show the first few as examples
-    for i, suggestion in enumerate(all_suggestions[:5], 1):
+    # Show the first few as examples - no need to copy every suggestion
+    # into one big list just to print five of them
+    all_suggestions = chain.from_iterable(analysis_report[name]['suggestions'] for name in suggestion_counts)
+    for i, suggestion in enumerate(islice(all_suggestions, 5), 1):
         # Don't spam them with super long suggestions
         display_suggestion = suggestion[:100] + "..." if len(suggestion) > 100 else suggestion
         print(f"  {i}. {display_suggestion}")
     
-    if len(all_suggestions) > 5:
-        print(f"  ... and {len(all_suggestions) - 5} more suggestions")
+    if total_suggestions > 5:
+        print(f"  ... and {total_suggestions - 5} more suggestions")
     
     # Phase 2: Agent 2 tries to fix stuff
     print("\n" + "=" * 80)
     print("PHASE 2: AUTOMATED IMPROVEMENT APPLICATION")
     print("-" * 50)
     
-    print("Applying automated revisions...")
+    # Agent 2 has been warming up since the start, it's usually ready by now.
+    # Now's the time to show what it found out about Ollama.
+    revision_agent = agent_future.result()
+    for message in revision_agent.status_messages:
+        print(message)
     
-    # Fire up the revision agent
-    revision_agent = DocumentationRevisionAgent()
+    print("Applying automated revisions...", flush=True)
     
     # Time the revision process too
-    revision_start = time.time()
-    revision_result = revision_agent.process_document(url, analysis_report)
-    revision_time = time.time() - revision_start
+    revision_start = time.perf_counter()
+    # Hand over the page we already downloaded so Phase 2 doesn't fetch it again
+    revision_result = revision_agent.process_document(url, analysis_report, html=analyzer.content)
+    revision_time = time.perf_counter() - revision_start
     
     if 'error' in revision_result:
         print(f"FAILED: Revision process encountered an error: {revision_result['error']}")
@@ -125,12 +265,7 @@ def run_integrated_demo(url: str):
     print("PHASE 3: REPORT GENERATION AND FILE OUTPUT")
     print("-" * 50)
     
-    # Save the analysis results
-    with open('analysis_report.json', 'w', encoding='utf-8') as f:
-        json.dump(analysis_report, f, indent=2, ensure_ascii=False)
-    print("Analysis report saved to 'analysis_report.json'")
-    
-    # Save revision results
+    # Save revision results alongside the analysis
     revision_report = {
         "url": url,
         "processing_time": {
@@ -147,13 +282,20 @@ def run_integrated_demo(url: str):
         }
     }
     
-    with open('revision_report.json', 'w', encoding='utf-8') as f:
-        json.dump(revision_report, f, indent=2, ensure_ascii=False)
-    print("Revision report saved to 'revision_report.json'")
-    
-    # Save the improved HTML
-    with open('revised_article.html', 'w', encoding='utf-8') as f:
-        f.write(revision_result['revised_content'])
+    # The three files don't depend on each other, so write them side by side -
+    # the gzip/file I/O drops the GIL. Leaving the with block waits for all of
+    # them, and result() re-raises if any write failed.
+    with ThreadPoolExecutor(max_workers=3) as writer:
+        pending = [
+            writer.submit(_save_json, analysis_path, analysis_report, pretty),
+            writer.submit(_save_json, revision_path, revision_report, pretty),
+            writer.submit(_save_html, 'revised_article.html', revision_result['revised_content']),
+        ]
+    for future in pending:
+        future.result()
+    
+    print(f"Analysis report saved to '{analysis_path}'")
+    print(f"Revision report saved to '{revision_path}'")
     print("Revised article saved to 'revised_article.html'")
     
     # Wrap up with summary
@@ -162,7 +304,7 @@ def run_integrated_demo(url: str):
     print("=" * 80)
     
     print(f"Total processing time: {(analysis_time + revision_time):.2f} seconds")
-    print(f"Analysis: {len([s for section in analysis_report.values() if isinstance(section, dict) for s in section.get('suggestions', [])])} total suggestions")
+    print(f"Analysis: {total_suggestions} total suggestions")
     print(f"Revisions: {len(applied_suggestions)} categories of improvements applied")
     print(f"Success rate: {success_rate:.1f}% of suggestions automated")
     
@@ -170,8 +312,8 @@ def run_integrated_demo(url: str):
     print("\nNEXT STEPS:")
     print("-" * 11)
     print("1. Review 'revised_article.html' to see the improved content")
-    print("2. Check 'analysis_report.json' for detailed suggestions")
-    print("3. Use 'revision_report.json' to track automation metrics")
+    print(f"2. Check '{analysis_path}' for detailed suggestions")
+    print(f"3. Use '{revision_path}' to track automation metrics")
     
     # Remind about AI features if they don't have them
     if not revision_agent.use_ai:
@@ -199,11 +341,19 @@ Examples:
         """
     )
     parser.add_argument('url', help='URL of the documentation to analyze and improve')
+    parser.add_argument('--gzip', action='store_true', help='Write the JSON reports gzipped (.json.gz)')
+    parser.add_argument('--pretty', action='store_true', help='Indent the JSON reports so they are easier to read')
     
     args = parser.parse_args()
     
+    # A terminal flushes stdout on every newline, which is a write per line
+    # for the ~80 lines the demo prints. Buffer it instead - the progress
+    # lines before each slow step flush themselves so you still see them.
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False)
+    
     # Execute the complete demonstration workflow
-    run_integrated_demo(args.url)
+    run_integrated_demo(args.url, compress=args.gzip, pretty=args.pretty)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -4,7 +4,169 @@ import requests
 from typing import Dict, List, Tuple
 from bs4 import BeautifulSoup
 import os
-from documentation_analyzer import DocumentationAnalyzer
+import asyncio
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from documentation_analyzer import DocumentationAnalyzer, SHARED_SESSION
+
+# orjson encodes the request bodies faster, but it's optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# These run against every text node in the document, so compile them once
+# up front instead of having re look them up on each call
+
+# Contraction mappings, keyed by the lowercased phrase
+_CONTRACTION_MAP = {
+    'it is': "it's",
+    'you are': "you're",
+    'you will': "you'll",
+    'we are': "we're",
+    'let us': "let's",
+    'do not': "don't",
+    'will not': "won't",
+    'cannot': "can't",
+    'should not': "shouldn't",
+    'would not': "wouldn't",
+    'could not': "couldn't",
+    'that is': "that's",
+    'there is': "there's",
+    'what is': "what's",
+}
+
+# Verbose phrases and their concise alternatives
+_VERBOSE_MAP = {
+    'in order to': 'to',
+    'due to the fact that': 'because',
+    'in the event that': 'if',
+    'at this point in time': 'now',
+    'for the purpose of': 'to',
+    'with regard to': 'about',
+    'in spite of the fact that': 'although',
+    'until such time as': 'until',
+    'as a result of': 'because',
+    'prior to': 'before',
+    'subsequent to': 'after',
+    'in addition to': 'besides',
+    'a large number of': 'many',
+    'a great deal of': 'much',
+    'on a regular basis': 'regularly',
+    'make a decision': 'decide',
+    'give consideration to': 'consider',
+}
+
+# One alternation per group, so each text node gets scanned once per group
+# instead of once per phrase. Word boundaries (\b) avoid partial word matches.
+_CONTRACTION_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, _CONTRACTION_MAP)) + r')\b', re.IGNORECASE)
+_VERBOSE_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, _VERBOSE_MAP)) + r')\b', re.IGNORECASE)
+# Redundant introductory phrases just get dropped, along with the space after them
+_FILLER_RE = re.compile(
+    r'\b(?:it is important to note that|please be aware that|it should be noted that)\s*',
+    re.IGNORECASE
+)
+
+def _keep_case(replacement_map: Dict[str, str]):
+    """
+    Builds a re.sub callback that looks the match up in replacement_map,
+    keeping the capital if the phrase started a sentence ("It is" -> "It's").
+    """
+    def replace(match):
+        phrase = match.group()
+        replacement = replacement_map[phrase.lower()]
+        if phrase[0].isupper():
+            return replacement[:1].upper() + replacement[1:]
+        return replacement
+    return replace
+
+_CONTRACTION_SUB = _keep_case(_CONTRACTION_MAP)
+_VERBOSE_SUB = _keep_case(_VERBOSE_MAP)
+
+# Spacing fixes in one pass: remove the spaces around dashes (group 2, keeping
+# any punctuation right before them) or squash runs of spaces after end
+# punctuation down to one (group 3). The (?<!\s) makes a dash match start at
+# the beginning of a whitespace run - otherwise a long run with no dash after
+# it gets rescanned from every position, which is quadratic.
+_SPACING_RE = re.compile(r'([.!?]?)(?<!\s)\s+([—-])\s+|([.!?])\s{2,}')
+
+def _fix_spacing(match) -> str:
+    """re.sub callback for _SPACING_RE."""
+    if match.group(2):
+        return match.group(1) + match.group(2)
+    return match.group(3) + ' '
+
+# Text inside these never gets rewritten - it's code, not prose
+_SKIP_TEXT_PARENTS = frozenset({'script', 'style', 'code', 'pre'})
+
+# Acronyms that stay in capitals when a heading goes to sentence case. Only
+# ones that aren't also ordinary words - "rest" or "sass" would get mangled.
+_KEEP_UPPER = frozenset({
+    'API', 'UI', 'ID', 'URL', 'SDK', 'HTTP', 'JSON',
+    'SSL', 'TLS', 'XML', 'YAML', 'CSS', 'HTML', 'SQL'
+})
+
+# Lists without an Oxford comma
+_OXFORD_RE = re.compile(r'\b(\w+),\s+(\w+)\s+and\s+(\w+)\b')
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+# Cheap check for what the AI prompt actually fixes - passive voice ("is
+# configured") and weak constructions ("you can", "there are"). Paragraphs
+# without any of these aren't worth a round trip to the model.
+_AI_CANDIDATE_RE = re.compile(
+    r'\b(?:is|was|are|were|be|been)\s+\w+ed\b|\byou can\b|\bthere (?:is|are)\b',
+    re.IGNORECASE
+)
+# What we ask the model to do - the same rules whether it gets one paragraph
+# or a numbered batch of them
+_PROMPT_RULES = """You are a technical writing expert who improves documentation clarity according to Microsoft Style Guide principles.
+
+Improve {what} according to Microsoft Style Guide principles:
+1. Use active voice instead of passive voice
+2. Replace weak constructions like "you can" and "there is/are" with direct action
+3. Simplify complex sentences
+4. Make it more action-oriented and direct
+5. Maintain the original meaning and technical accuracy
+"""
+
+_PROMPT_TEMPLATE = _PROMPT_RULES.format(what="the following documentation paragraph") + """
+Original paragraph:
+{paragraph}
+
+Provide ONLY the improved paragraph text, no explanations or additional text:"""
+
+_BATCH_PROMPT_TEMPLATE = _PROMPT_RULES.format(what="each of the following numbered documentation paragraphs") + """
+Original paragraphs:
+{paragraphs}
+
+Provide ONLY the improved paragraphs as a numbered list in the same order, one per number, no explanations or additional text:"""
+
+# Lower temperature for more consistent output
+_OLLAMA_OPTIONS = {"temperature": 0.3}
+
+# "1. ", "2. " ... at the start of a line in a batched AI reply
+_NUMBERED_ITEM_RE = re.compile(r'^\d+\.\s', re.MULTILINE)
+
+def _more_words_than(text: str, limit: int) -> bool:
+    """True if text has more than limit whitespace-separated words."""
+    # Each word needs at least one character plus a space before the next
+    # one, so text this short can't get there - no need to build the list
+    if len(text) <= 2 * limit:
+        return False
+    return len(text.split()) > limit
+
+# Tokens to spare for a "Here's the improved paragraph:" lead-in on top of the rewrite
+_PREAMBLE_TOKENS = 30
+
+def _num_predict_for(text: str) -> int:
+    """
+    Token budget for rewriting one paragraph.
+    
+    English runs ~1.3 tokens a word, so two tokens a word leaves room for a
+    rewrite that comes out a bit longer than the original, plus a fixed
+    allowance for any preamble. Still sized to the paragraph, so a short
+    one can't get padded out to some big fixed limit.
+    """
+    return 2 * len(text.split()) + _PREAMBLE_TOKENS
 
 class DocumentationRevisionAgent:
     """
@@ -21,26 +183,67 @@ class DocumentationRevisionAgent:
     can focus on the creative stuff.
     """
     
-    def __init__(self, ollama_model: str = "llama3.2:3b", ollama_url: str = "http://localhost:11434"):
-        """Set up the revision agent, with optional AI superpowers."""
+    # How many paragraphs we send to Ollama at once. Ollama queues anything
+    # beyond its own OLLAMA_NUM_PARALLEL, so there's no point going much higher.
+    _AI_WORKERS = 4
+    # Paragraphs per Ollama request - the instructions get encoded once per
+    # batch instead of once per paragraph
+    _AI_BATCH_SIZE = 5
+    # Paragraph rewrites from earlier runs, keyed by model + paragraph hash
+    _AI_CACHE_PATH = os.path.join('.cache', 'ai_revisions.json')
+    
+    def __init__(self, ollama_model: str = "llama3.2:3b", ollama_url: str = "http://localhost:11434",
+                 session: requests.Session = None, quiet: bool = False):
+        """
+        Set up the revision agent, with optional AI superpowers.
+        
+        With quiet=True the Ollama status lines aren't printed, just kept in
+        status_messages - handy when the agent is built in the background and
+        the caller wants to show them at a better moment.
+        """
         self.ollama_model = ollama_model
         self.ollama_url = ollama_url
+        self.quiet = quiet
+        self.status_messages = []
+        # Same connection pool as the analyzer, so fetching the article again
+        # reuses its keep-alive connection instead of a fresh TLS handshake
+        self.session = session or SHARED_SESSION
         # Check if we can use AI, otherwise stick to rule-based fixes
         self.use_ai = self._check_ollama_availability()
         
         if not self.use_ai:
-            print("INFO: Ollama not available. Will use rule-based revisions only.")
-            print("TIP: To enable AI-assisted revisions:")
-            print("   1. Install Ollama: brew install ollama")
-            print("   2. Start service: brew services start ollama")
-            print("   3. Download model: ollama pull llama3.2:3b")
+            self._status("INFO: Ollama not available. Will use rule-based revisions only.")
+            self._status("TIP: To enable AI-assisted revisions:")
+            self._status("   1. Install Ollama: brew install ollama")
+            self._status("   2. Start service: brew services start ollama")
+            self._status("   3. Download model: ollama pull llama3.2:3b")
         
         # We'll populate these when process_document() is called
         self.original_content = None
-        self.soup = None
+        self._soup = None  # Original document, parsed on demand - see the soup property
+        self.revised_soup = None  # The tree the revisions get applied to
+        self._long_paragraphs = False
         self.suggestions = None
         self.revised_content = None
         
+    @property
+    def soup(self) -> BeautifulSoup:
+        """
+        The original document, parsed.
+        
+        The revisions work on their own tree (revised_soup), so this one always
+        matches original_content. Only parsed if someone actually asks for it.
+        """
+        if self._soup is None and self.original_content is not None:
+            self._soup = BeautifulSoup(self.original_content, 'lxml')
+        return self._soup
+    
+    def _status(self, message: str):
+        """Prints a setup message, or just holds on to it if we're being quiet."""
+        self.status_messages.append(message)
+        if not self.quiet:
+            print(message)
+    
     def _check_ollama_availability(self) -> bool:
         """
         See if Ollama is running and has our model ready to go.
@@ -51,19 +254,19 @@ class DocumentationRevisionAgent:
         3. Can we make basic API calls?
         """
         try:
-            response = requests.get(f"{self.ollama_url}/api/tags", timeout=5)
+            response = self.session.get(f"{self.ollama_url}/api/tags", timeout=5)
             if response.status_code == 200:
                 models = response.json().get('models', [])
                 available_models = [model['name'] for model in models]
                 
                 # Look for our specific model
                 if self.ollama_model in available_models or f"{self.ollama_model}:latest" in available_models:
-                    print(f"SUCCESS: Ollama available with model: {self.ollama_model}")
+                    self._status(f"SUCCESS: Ollama available with model: {self.ollama_model}")
                     return True
                 else:
-                    print(f"WARNING: Ollama available but model '{self.ollama_model}' not found.")
-                    print(f"Available models: {', '.join(available_models[:3])}{'...' if len(available_models) > 3 else ''}")
-                    print(f"TIP: Install model: ollama pull {self.ollama_model}")
+                    self._status(f"WARNING: Ollama available but model '{self.ollama_model}' not found.")
+                    self._status(f"Available models: {', '.join(available_models[:3])}{'...' if len(available_models) > 3 else ''}")
+                    self._status(f"TIP: Install model: ollama pull {self.ollama_model}")
                     return False
             else:
                 return False
@@ -71,28 +274,40 @@ class DocumentationRevisionAgent:
             # Ollama server isn't running or we can't reach it
             return False
     
-    def process_document(self, url: str, suggestions: Dict = None) -> Dict:
+    def process_document(self, url: str, suggestions: Dict = None, html: str = None) -> Dict:
         """
         The main event - takes a URL and applies all the improvements we can.
         
         Here's what happens:
-        1. Grab the original document
+        1. Grab the original document (skipped if you pass in its html)
         2. Get suggestions (either use provided ones or generate fresh)
         3. Apply all the fixes we can safely automate
         4. Return a report of what we changed
         """
-        # First, get the original document
-        analyzer = DocumentationAnalyzer()
-        if not analyzer.fetch_article(url):
-            return {"error": "Failed to fetch article"}
-        
-        # Save the original for comparison
-        self.original_content = analyzer.content
-        self.soup = BeautifulSoup(self.original_content, 'html.parser')
+        # First, get the original document - unless the caller already
+        # downloaded it, then there's no point fetching it a second time
+        analyzer = None
+        if html is None:
+            analyzer = DocumentationAnalyzer(session=self.session)
+            if not analyzer.fetch_article(url):
+                return {"error": "Failed to fetch article"}
+            html = analyzer.content
+        
+        # Save the original for comparison, and parse the copy we're going to
+        # revise. lxml is a lot quicker than html.parser, and it's what the
+        # analyzer parses with too.
+        self.original_content = html
+        self._soup = None
+        self.revised_soup = BeautifulSoup(self.original_content, 'lxml')
         
         # If no suggestions provided, generate them ourselves
         # Makes this agent work standalone
+        # (we only need an analyzer at all if we're fetching or analyzing)
         if suggestions is None:
+            if analyzer is None:
+                analyzer = DocumentationAnalyzer(session=self.session)
+                if not analyzer.load_html(url, html):
+                    return {"error": "Failed to process article"}
             suggestions = analyzer.generate_report()
         
         self.suggestions = suggestions
@@ -109,6 +324,17 @@ class DocumentationRevisionAgent:
             "revision_summary": self._generate_revision_summary()
         }
     
+    async def process_document_async(self, url: str, suggestions: Dict = None, html: str = None) -> Dict:
+        """
+        process_document() for async callers (FastAPI, Quart, aiohttp...).
+        
+        The fetch, parse, regex passes and Ollama calls all block, so the
+        whole thing runs on a worker thread and the event loop stays free
+        for other requests. The agent keeps per-document state, so use one
+        agent per document you want to process at the same time.
+        """
+        return await asyncio.to_thread(self.process_document, url, suggestions, html)
+    
     def _apply_all_revisions(self) -> str:
         """
         Apply improvements in order of confidence level.
@@ -118,16 +344,24 @@ class DocumentationRevisionAgent:
         2. Structure improvements (pretty safe)
         3. AI content improvements (depends on model quality)
         """
-        # Start fresh with the original
-        revised_soup = BeautifulSoup(self.original_content, 'html.parser')
+        # Work straight on the tree process_document() parsed - no point parsing
+        # the same html twice. The original stays available through self.soup.
+        revised_soup = self.revised_soup
+        
+        # Find the paragraphs once and hand the same list to every step
+        # that needs them. The style fixes only swap text inside them, so
+        # the list stays good until the structure step splits some up.
+        paragraphs = revised_soup.find_all('p')
+        # The revisions edit the soup in place, so check the original first
+        self._long_paragraphs = self._has_long_paragraphs(paragraphs)
         
         # Apply the safe stuff first
         revised_soup = self._apply_microsoft_style_fixes(revised_soup)
-        revised_soup = self._apply_structure_improvements(revised_soup)
+        revised_soup = self._apply_structure_improvements(revised_soup, paragraphs)
         
         # Add AI magic if available
         if self.use_ai:
-            revised_soup = self._apply_ai_revisions(revised_soup)
+            revised_soup = self._apply_ai_revisions(revised_soup, paragraphs)
         
         return str(revised_soup)
     
@@ -142,125 +376,62 @@ class DocumentationRevisionAgent:
         - Fix heading capitalization
         - Add Oxford commas
         
-        We skip script/style tags because we don't want to break code.
+        We skip script/style tags and code samples because we don't want to break code.
         """
         
-        # Go through all text in the document
-        text_elements = soup.find_all(text=True)
+        # Go through all text in the document - once. Every text fix works on
+        # a single string, so there's no need to walk the tree again per fix.
+        text_elements = [
+            element for element in soup.find_all(string=True)
+            if element.parent.name not in _SKIP_TEXT_PARENTS
+        ]
         
         for element in text_elements:
-            if element.parent.name in ['script', 'style']:
-                continue  # Don't mess with code
-                
-            original_text = str(element)
-            revised_text = original_text
+            # A lot of these are just the newlines/indentation between tags,
+            # which none of the fixes would touch anyway
+            if element.isspace():
+                continue
             
-            # Apply text improvements
-            revised_text = self._add_contractions(revised_text)
-            revised_text = self._simplify_verbose_phrases(revised_text)
-            revised_text = self._fix_spacing_issues(revised_text)
+            original_text = str(element)
+            revised_text = self._revise_text(original_text)
             
             # Only change it if we actually improved something
             if revised_text != original_text:
                 element.replace_with(revised_text)
         
-        # Handle HTML structure fixes
+        # Handle HTML structure fixes - after the text fixes, so the heading
+        # rules see the final wording
         soup = self._fix_heading_issues(soup)
-        soup = self._add_oxford_commas(soup)
         
         return soup
     
-    def _add_contractions(self, text: str) -> str:
+    def _revise_text(self, text: str) -> str:
         """
-        Make the tone friendlier by adding contractions.
-        
-        Microsoft Style Guide says contractions make docs more approachable.
-        We stick to the common ones that won't confuse anyone.
+        Run every text-level style fix over one string, in a fixed order.
         
         Args:
             text: The text to process
             
         Returns:
-            str: Text with contractions applied
-        """
-        # Define our contraction mappings
-        # We use word boundaries (\b) to avoid partial word matches
-        contractions = {
-            r'\bit is\b': "it's",
-            r'\byou are\b': "you're", 
-            r'\byou will\b': "you'll",
-            r'\bwe are\b': "we're",
-            r'\blet us\b': "let's",
-            r'\bdo not\b': "don't",
-            r'\bwill not\b': "won't",
-            r'\bcannot\b': "can't",
-            r'\bshould not\b': "shouldn't",
-            r'\bwould not\b': "wouldn't",
-            r'\bcould not\b': "couldn't",
-            r'\bthat is\b': "that's",
-            r'\bthere is\b': "there's",
-            r'\bwhat is\b': "what's"
-        }
-        
-        # Apply each contraction pattern
-        for pattern, replacement in contractions.items():
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-        
-        return text
-    
-    def _simplify_verbose_phrases(self, text: str) -> str:
+            str: The revised text
         """
-        Replace unnecessarily verbose phrases with concise alternatives.
-        
-        This implements the Microsoft Style Guide principle of "use bigger ideas,
-        fewer words." We target common wordy phrases that can be simplified
-        without changing meaning.
-        
-        Args:
-            text: The text to process
-            
-        Returns:
-            str: Text with verbose phrases simplified
-        """
-        # Map verbose phrases to concise alternatives
-        replacements = {
-            r'\bin order to\b': 'to',
-            r'\bdue to the fact that\b': 'because',
-            r'\bin the event that\b': 'if',
-            r'\bat this point in time\b': 'now',
-            r'\bfor the purpose of\b': 'to',
-            r'\bwith regard to\b': 'about',
-            r'\bin spite of the fact that\b': 'although',
-            r'\buntil such time as\b': 'until',
-            r'\bas a result of\b': 'because',
-            r'\bprior to\b': 'before',
-            r'\bsubsequent to\b': 'after',
-            r'\bin addition to\b': 'besides',
-            r'\ba large number of\b': 'many',
-            r'\ba great deal of\b': 'much',
-            r'\bon a regular basis\b': 'regularly',
-            r'\bmake a decision\b': 'decide',
-            r'\bgive consideration to\b': 'consider',
-            # Remove redundant introductory phrases
-            r'\bit is important to note that\s*': '',
-            r'\bplease be aware that\s*': '',
-            r'\bit should be noted that\s*': ''
-        }
+        # Contractions make the tone friendlier - Microsoft Style Guide says
+        # they make docs more approachable. We stick to the common ones.
+        text = _CONTRACTION_RE.sub(_CONTRACTION_SUB, text)
         
-        # Apply each simplification
-        for pattern, replacement in replacements.items():
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+        # "Use bigger ideas, fewer words" - swap wordy phrases for short ones
+        # and drop the filler intros that don't change the meaning
+        text = _VERBOSE_RE.sub(_VERBOSE_SUB, text)
+        text = _FILLER_RE.sub('', text)
         
-        return text
-    
-    def _fix_spacing_issues(self, text: str) -> str:
-        """Fix spacing issues."""
-        # Single space after punctuation
-        text = re.sub(r'([.!?])\s{2,}', r'\1 ', text)
+        # Spacing after punctuation and around dashes
+        text = _SPACING_RE.sub(_fix_spacing, text)
         
-        # Remove spaces around dashes
-        text = re.sub(r'\s+—\s+', '—', text)
-        text = re.sub(r'\s+-\s+', '-', text)
+        # Oxford commas in simple lists. Most text has no comma-and-"and" list
+        # in it at all, and two substring checks are far cheaper than the regex.
+        # (Not ' and ' - the regex also allows newlines and tabs around it.)
+        if ',' in text and 'and' in text:
+            text = _OXFORD_RE.sub(r'\1, \2, and \3', text)
         
         return text
     
@@ -274,14 +445,12 @@ class DocumentationRevisionAgent:
             # Convert to sentence case (only first word capitalized)
             words = original_text.split()
             if words:
-                # Capitalize first word, lowercase others (except proper nouns)
-                revised_text = words[0].capitalize()
+                # Capitalize first word, lowercase others (except acronyms)
+                parts = [words[0].capitalize()]
                 for word in words[1:]:
-                    # Keep certain words capitalized (APIs, proper nouns, etc.)
-                    if word.upper() in ['API', 'UI', 'ID', 'URL', 'SDK', 'HTTP', 'JSON']:
-                        revised_text += ' ' + word.upper()
-                    else:
-                        revised_text += ' ' + word.lower()
+                    upper = word.upper()
+                    parts.append(upper if upper in _KEEP_UPPER else word.lower())
+                revised_text = ' '.join(parts)
                 
                 # Remove end punctuation if heading is short
                 if len(words) <= 3:
@@ -293,39 +462,23 @@ class DocumentationRevisionAgent:
         
         return soup
     
-    def _add_oxford_commas(self, soup: BeautifulSoup) -> BeautifulSoup:
-        """Add Oxford commas to lists."""
-        text_elements = soup.find_all(text=True)
-        
-        for element in text_elements:
-            if element.parent.name in ['script', 'style']:
-                continue
-                
-            original_text = str(element)
-            # Pattern for lists without Oxford comma
-            revised_text = re.sub(
-                r'\b(\w+),\s+(\w+)\s+and\s+(\w+)\b',
-                r'\1, \2, and \3',
-                original_text
-            )
-            
-            if revised_text != original_text:
-                element.replace_with(revised_text)
+    def _apply_structure_improvements(self, soup: BeautifulSoup, paragraphs: List) -> BeautifulSoup:
+        """
+        Apply structural improvements like breaking long paragraphs.
         
-        return soup
-    
-    def _apply_structure_improvements(self, soup: BeautifulSoup) -> BeautifulSoup:
-        """Apply structural improvements like breaking long paragraphs."""
-        paragraphs = soup.find_all('p')
+        paragraphs is the document's <p> tags in order. It gets updated in
+        place, so split paragraphs show up as their two halves afterwards.
+        """
+        updated = []
         
         for p in paragraphs:
+            updated.append(p)
             text = p.get_text(strip=True)
-            words = text.split()
             
             # Break long paragraphs (>100 words)
-            if len(words) > 100:
+            if _more_words_than(text, 100):
                 # Split at sentence boundaries around the middle
-                sentences = re.split(r'(?<=[.!?])\s+', text)
+                sentences = _SENTENCE_SPLIT_RE.split(text)
                 if len(sentences) > 2:
                     mid_point = len(sentences) // 2
                     first_part = ' '.join(sentences[:mid_point])
@@ -341,10 +494,12 @@ class DocumentationRevisionAgent:
                     p.insert_before(new_p1)
                     p.insert_before(new_p2)
                     p.decompose()
+                    updated[-1:] = [new_p1, new_p2]
         
+        paragraphs[:] = updated
         return soup
     
-    def _apply_ai_revisions(self, soup: BeautifulSoup) -> BeautifulSoup:
+    def _apply_ai_revisions(self, soup: BeautifulSoup, paragraphs: List) -> BeautifulSoup:
         """
         Apply AI-powered improvements to content that require contextual understanding.
         
@@ -357,6 +512,7 @@ class DocumentationRevisionAgent:
         
         Args:
             soup: BeautifulSoup object containing the HTML to improve
+            paragraphs: Every <p> tag in soup, in document order
             
         Returns:
             BeautifulSoup: Updated soup with AI improvements applied
@@ -369,21 +525,118 @@ class DocumentationRevisionAgent:
         main_content = soup.find('article') or soup.find('main') or soup.find('body')
         
         if main_content:
-            paragraphs = main_content.find_all('p')
-            
-            # Process each paragraph individually for better quality control
+            # Only apply AI to substantial paragraphs to make it worthwhile
+            # Short paragraphs often don't need AI improvement, and ones that
+            # are already active and direct don't either
+            candidates = []
             for p in paragraphs:
+                # Tag == compares whole subtrees, so check ancestry by identity
+                if not any(parent is main_content for parent in p.parents):
+                    continue
                 text = p.get_text(strip=True)
-                
-                # Only apply AI to substantial paragraphs to make it worthwhile
-                # Short paragraphs often don't need AI improvement
-                if len(text.split()) > 20:
-                    revised_text = self._ai_improve_paragraph(text)
-                    if revised_text and revised_text != text:
-                        p.string = revised_text
+                if _more_words_than(text, 20) and _AI_CANDIDATE_RE.search(text):
+                    candidates.append((p, text))
+            
+            # Paragraphs we've already rewritten on an earlier run (same model,
+            # same text) come straight from the cache - no need to ask again
+            cache = self._load_ai_cache()
+            revisions = {}
+            texts = []
+            for _, text in candidates:
+                key = self._ai_cache_key(text)
+                if key in cache:
+                    revisions[text] = cache[key]
+                elif text not in revisions:
+                    revisions[text] = None
+                    texts.append(text)
+            
+            # Send the rest over a few at a time so the instructions only
+            # get encoded once per batch, and keep a few batches in flight at
+            # once instead of waiting out every round trip in turn
+            batches = [texts[i:i + self._AI_BATCH_SIZE] for i in range(0, len(texts), self._AI_BATCH_SIZE)]
+            with ThreadPoolExecutor(max_workers=self._AI_WORKERS) as executor:
+                for batch, revised_batch in zip(batches, executor.map(self._ai_improve_paragraphs_batch, batches)):
+                    for text, revised_text in zip(batch, revised_batch):
+                        revisions[text] = revised_text
+                        # Only remember real improvements - a failed request
+                        # should get another go next time
+                        if revised_text and revised_text != text:
+                            cache[self._ai_cache_key(text)] = revised_text
+            
+            for p, text in candidates:
+                revised_text = revisions[text]
+                if revised_text and revised_text != text:
+                    p.string = revised_text
+            
+            if texts:
+                self._save_ai_cache(cache)
         
         return soup
     
+    def _ai_cache_key(self, text: str) -> str:
+        """Cache key for a paragraph - rewrites from a different model don't count."""
+        return f"{self.ollama_model}:{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+    
+    def _load_ai_cache(self) -> Dict[str, str]:
+        """Returns the saved paragraph rewrites, or an empty dict if there aren't any."""
+        try:
+            with open(self._AI_CACHE_PATH, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            # Nothing cached yet (or a half-written file) - start over
+            return {}
+    
+    def _save_ai_cache(self, cache: Dict[str, str]):
+        """Saves the paragraph rewrites. Writes to a temp file first so readers never see half a file."""
+        try:
+            os.makedirs(os.path.dirname(self._AI_CACHE_PATH), exist_ok=True)
+            tmp_path = f"{self._AI_CACHE_PATH}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(cache, ensure_ascii=False))
+            os.replace(tmp_path, self._AI_CACHE_PATH)
+        except OSError as e:
+            print(f"WARNING: Couldn't cache the AI revisions: {e}")
+    
+    def _ai_improve_paragraphs_batch(self, texts: List[str]) -> List[str]:
+        """
+        Use AI to improve several paragraphs with a single request.
+        
+        The paragraphs go out as a numbered list and we expect a numbered
+        list back. If the model doesn't give us one item per paragraph we
+        can't tell which rewrite goes where, so we fall back to asking about
+        each paragraph on its own.
+        
+        Args:
+            texts: The original paragraph texts to improve
+            
+        Returns:
+            List[str]: One entry per paragraph - the improved text, or the
+            original if improvement failed
+        """
+        if len(texts) == 1:
+            return [self._ai_improve_paragraph(texts[0])]
+        
+        # An earlier request may have switched AI off while this one was queued
+        if not self.use_ai:
+            return texts
+        
+        numbered = '\n\n'.join(f"{i}. {text}" for i, text in enumerate(texts, 1))
+        prompt_text = _BATCH_PROMPT_TEMPLATE.format(paragraphs=numbered)
+        
+        # Each paragraph gets its own headroom, plus a bit for the "1. ", "2. " markers
+        num_predict = sum(_num_predict_for(text) for text in texts) + 5 * len(texts)
+        response_text = self._ollama_generate(prompt_text, num_predict=num_predict)
+        if response_text is None:
+            return texts
+        
+        # Everything before the first number is preamble ("Here are the...")
+        items = _NUMBERED_ITEM_RE.split(response_text)[1:]
+        if len(items) != len(texts):
+            print(f"AI batch reply had {len(items)} items for {len(texts)} paragraphs - retrying them one by one")
+            return [self._ai_improve_paragraph(text) for text in texts]
+        
+        return [self._clean_ai_response(text, item.strip()) for text, item in zip(texts, items)]
+    
     def _ai_improve_paragraph(self, text: str) -> str:
         """
         Use AI to improve a single paragraph according to style guidelines.
@@ -399,106 +652,190 @@ class DocumentationRevisionAgent:
         Returns:
             str: The improved paragraph text, or original if improvement failed
         """
+        # An earlier request may have switched AI off while this one was queued
+        if not self.use_ai:
+            return text
+        
+        # Craft a specific prompt that gives the AI clear guidelines
+        # This helps ensure consistent, high-quality improvements
+        prompt_text = _PROMPT_TEMPLATE.format(paragraph=text)
+        
+        # We only ever keep the first real line of the answer, so let the
+        # request hang up as soon as that line is done
+        improved_text = self._ollama_generate(prompt_text, num_predict=_num_predict_for(text), first_line_only=True)
+        if improved_text is None:
+            return text
+        
+        return self._clean_ai_response(text, improved_text)
+    
+    def _ollama_generate(self, prompt_text: str, num_predict: int, first_line_only: bool = False) -> str:
+        """
+        Send one prompt to Ollama and hand back the raw response text.
+        
+        Args:
+            prompt_text: The full prompt
+            num_predict: Cap on how many tokens the model may generate
+            first_line_only: Stream the answer and stop reading once the
+                first meaningful line (see _first_ai_line) is complete -
+                closing the connection makes Ollama stop generating too
+            
+        Returns:
+            str: The stripped response text, or None if the request failed
+        """
         try:
-            # Craft a specific prompt that gives the AI clear guidelines
-            # This helps ensure consistent, high-quality improvements
-            prompt_text = f"""You are a technical writing expert who improves documentation clarity according to Microsoft Style Guide principles.
-
-Improve the following documentation paragraph according to Microsoft Style Guide principles:
-1. Use active voice instead of passive voice
-2. Replace weak constructions like "you can" and "there is/are" with direct action
-3. Simplify complex sentences
-4. Make it more action-oriented and direct
-5. Maintain the original meaning and technical accuracy
-
-Original paragraph:
-{text}
-
-Provide ONLY the improved paragraph text, no explanations or additional text:"""
+            body = {
+                "model": self.ollama_model,
+                "prompt": prompt_text,
+                # Either the complete response at once, or token by token
+                # when we're going to cut it short anyway
+                "stream": first_line_only,
+                # Limit response length to keep it focused
+                "options": {**_OLLAMA_OPTIONS, "num_predict": num_predict}
+            }
             
             # Make the API request to our local Ollama server
-            response = requests.post(
+            response = self.session.post(
                 f"{self.ollama_url}/api/generate",
-                json={
-                    "model": self.ollama_model,
-                    "prompt": prompt_text,
-                    "stream": False,  # We want the complete response at once
-                    "options": {
-                        "temperature": 0.3,  # Lower temperature for more consistent output
-                        "num_predict": 150   # Limit response length to keep it focused
-                    }
-                },
-                timeout=60  # Give it time to process but don't wait forever
+                data=orjson.dumps(body) if orjson is not None else json.dumps(body),
+                headers={'Content-Type': 'application/json'},
+                timeout=60,  # Give it time to process but don't wait forever
+                stream=first_line_only
             )
             
-            if response.status_code == 200:
+            if response.status_code == 200 and first_line_only:
+                return self._read_first_line(response)
+            elif response.status_code == 200:
                 result = response.json()
+                if result.get('done_reason') == 'length':
+                    # Ran out of tokens mid-rewrite - half a paragraph is worse than none
+                    print("WARNING: Ollama hit the token limit before finishing - keeping the original text")
+                    return None
                 if 'response' in result:
-                    improved_text = result['response'].strip()
-                    
-                    # Clean up the AI response to extract just the improved text
-                    if improved_text and improved_text != text:
-                        # Remove common AI response prefixes
-                        prefixes_to_remove = [
-                            "Here's the improved paragraph:",
-                            "Here's an improved version:",
-                            "Improved paragraph:",
-                            "Here's the improved text:",
-                            "Revised version:",
-                            "Here's the revision:"
-                        ]
-                        
-                        for prefix in prefixes_to_remove:
-                            if improved_text.lower().startswith(prefix.lower()):
-                                improved_text = improved_text[len(prefix):].strip()
-                                break
-                        
-                        # Remove quotes if the AI wrapped the response in quotes
-                        if improved_text.startswith('"') and improved_text.endswith('"'):
-                            improved_text = improved_text[1:-1].strip()
-                        
-                        # Take only the first meaningful paragraph to avoid rambling
-                        lines = improved_text.split('\n')
-                        # Get the first non-empty line as the improved text
-                        for line in lines:
-                            line = line.strip()
-                            if line and not line.lower().startswith(('here', 'this', 'the revised')):
-                                improved_text = line
-                                break
-                        
-                        # Only return if we got meaningful improvement
-                        if improved_text and len(improved_text) > 10 and improved_text != text:
-                            print(f"AI improved: '{text[:50]}...' -> '{improved_text[:50]}...'")
-                            return improved_text
-                        else:
-                            print(f"AI improvement not useful for: '{text[:50]}...'")
-                            return text
-                    else:
-                        return text
+                    return result['response'].strip()
                 else:
                     print("ERROR: Ollama API returned empty response")
-                    return text
+                    return None
             elif response.status_code == 400:
                 print("ERROR: Ollama API bad request - check model and prompt")
                 self.use_ai = False  # Disable AI for remaining requests to avoid spam
-                return text
+                return None
             elif response.status_code == 404:
                 print("ERROR: Ollama API model not found - check if model is downloaded")
                 self.use_ai = False  # Disable AI for remaining requests
-                return text
+                return None
             elif response.status_code == 429:
                 print("WARNING: Ollama API rate limit exceeded - continuing with rule-based revisions only")
-                return text
+                return None
             else:
                 print(f"ERROR: Ollama API failed with HTTP {response.status_code}")
                 if response.text:
                     error_message = response.text
                     print(f"Error details: {error_message}")
-                return text
+                return None
                 
         except Exception as e:
             print(f"ERROR: AI revision failed: {e}")
+            return None
+    
+    def _read_first_line(self, response: requests.Response) -> str:
+        """
+        Read a streamed Ollama answer until its first meaningful line is done.
+        
+        Ollama streams one JSON object per line, each carrying the next bit
+        of the answer in 'response' and 'done': true on the last one.
+        
+        Returns:
+            str: The stripped text received so far, or None if it failed
+        """
+        with response:
+            answer = ''
+            received = False
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                if 'error' in chunk:
+                    print(f"ERROR: Ollama API failed: {chunk['error']}")
+                    return None
+                if 'response' in chunk:
+                    received = True
+                    answer += chunk['response']
+                if chunk.get('done'):
+                    if chunk.get('done_reason') == 'length':
+                        # The first line never finished before the token
+                        # limit, so what we have is cut off mid-sentence
+                        print("WARNING: Ollama hit the token limit before finishing - keeping the original text")
+                        return None
+                    break
+                # Everything up to the last newline is finished text - once
+                # that holds a line we'd keep, the rest would be thrown away
+                if '\n' in chunk.get('response', ''):
+                    finished = answer[:answer.rfind('\n')].strip()
+                    if self._first_ai_line(self._strip_ai_preamble(finished)):
+                        break
+        
+        if not received:
+            print("ERROR: Ollama API returned empty response")
+            return None
+        return answer.strip()
+    
+    def _clean_ai_response(self, text: str, improved_text: str) -> str:
+        """
+        Pull just the improved paragraph out of what the model sent back.
+        
+        Args:
+            text: The original paragraph text
+            improved_text: The model's answer for that paragraph
+            
+        Returns:
+            str: The improved paragraph text, or original if it wasn't useful
+        """
+        # Clean up the AI response to extract just the improved text
+        if not improved_text or improved_text == text:
             return text
+        
+        improved_text = self._strip_ai_preamble(improved_text)
+        # Take only the first meaningful paragraph to avoid rambling
+        improved_text = self._first_ai_line(improved_text) or improved_text
+        
+        # Only return if we got meaningful improvement
+        if improved_text and len(improved_text) > 10 and improved_text != text:
+            print(f"AI improved: '{text[:50]}...' -> '{improved_text[:50]}...'")
+            return improved_text
+        else:
+            print(f"AI improvement not useful for: '{text[:50]}...'")
+            return text
+    
+    def _strip_ai_preamble(self, improved_text: str) -> str:
+        """Drop the "Here's the improved paragraph:" lead-in and wrapping quotes."""
+        # Remove common AI response prefixes
+        prefixes_to_remove = [
+            "Here's the improved paragraph:",
+            "Here's an improved version:",
+            "Improved paragraph:",
+            "Here's the improved text:",
+            "Revised version:",
+            "Here's the revision:"
+        ]
+        
+        for prefix in prefixes_to_remove:
+            if improved_text.lower().startswith(prefix.lower()):
+                improved_text = improved_text[len(prefix):].strip()
+                break
+        
+        # Remove quotes if the AI wrapped the response in quotes
+        if improved_text.startswith('"') and improved_text.endswith('"'):
+            improved_text = improved_text[1:-1].strip()
+        
+        return improved_text
+    
+    def _first_ai_line(self, improved_text: str) -> str:
+        """The first non-empty line that isn't more chatter, or None if there isn't one."""
+        for line in improved_text.split('\n'):
+            line = line.strip()
+            if line and not line.lower().startswith(('here', 'this', 'the revised')):
+                return line
+        return None
     
     def _get_applied_suggestions(self) -> List[str]:
         """
@@ -521,7 +858,7 @@ Provide ONLY the improved paragraph text, no explanations or additional text:"""
                 applied.append(f"Applied {category.replace('_', ' ')} fixes: {issues['message']}")
         
         # Add structure improvements if we made them
-        if self._has_long_paragraphs():
+        if self._long_paragraphs:
             applied.append("Applied structure improvements: broke up long paragraphs")
         
         # Add AI improvements if we used them
@@ -530,22 +867,21 @@ Provide ONLY the improved paragraph text, no explanations or additional text:"""
         
         return applied
     
-    def _has_long_paragraphs(self) -> bool:
+    def _has_long_paragraphs(self, paragraphs: List) -> bool:
         """
         Check if the original content contained paragraphs that needed breaking up.
         
         This is used to determine if we should report structure improvements
         in our applied suggestions list.
         
+        Args:
+            paragraphs: The original document's <p> tags
+        
         Returns:
             bool: True if original content had paragraphs longer than 100 words
         """
-        if not self.soup:
-            return False
-        
-        paragraphs = self.soup.find_all('p')
         for p in paragraphs:
-            if len(p.get_text().split()) > 100:
+            if _more_words_than(p.get_text(), 100):
                 return True
         return False
     
@@ -602,8 +938,11 @@ def main():
     
     parser = argparse.ArgumentParser(description='Revise documentation based on analysis suggestions')
     parser.add_argument('url', help='URL of the documentation article to revise')
-    parser.add_argument('--ollama-model', help='Ollama model name for AI-assisted revisions')
-    parser.add_argument('--ollama-url', help='Ollama server URL for AI-assisted revisions')
+    parser.add_argument('--ollama-model', default='llama3.2:3b',
+                        help='Ollama model name for AI-assisted revisions. 4-bit (q4) tags '
+                             'generate much faster than q8_0/fp16 ones')
+    parser.add_argument('--ollama-url', default='http://localhost:11434',
+                        help='Ollama server URL for AI-assisted revisions')
     parser.add_argument('--output', choices=['json', 'html'], default='json', help='Output format')
     args = parser.parse_args()
     
@@ -626,8 +965,8 @@ def main():
         }, indent=2))
     else:
         # Save the complete revised HTML for human review
-        with open('revised_article.html', 'w', encoding='utf-8') as f:
-            f.write(result["revised_content"])
+        with open('revised_article.html', 'wb') as f:
+            f.write(result["revised_content"].encode('utf-8'))
         print("Revised article saved to 'revised_article.html'")
         print(f"Applied {len(result['suggestions_applied'])} suggestion categories")
 
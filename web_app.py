@@ -6,13 +6,48 @@ Just a simple Flask app that gives you a nice web UI instead of
 having to mess around with command line arguments.
 """
 
-from flask import Flask, render_template, request, jsonify
-from documentation_analyzer import DocumentationAnalyzer
+from flask import Flask, render_template, request, jsonify, Response
+from documentation_analyzer import analyze_url
 import json
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+# orjson is a lot quicker at dumping the big report dicts, but it's optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 app = Flask(__name__)
 
+# Keeps one batch request from tying up the server for ages
+_BATCH_LIMIT = 32
+_BATCH_WORKERS = 8
+
+# How many analyses can run at once. Past that we tell the client to come
+# back later instead of letting requests pile up behind slow fetches
+_MAX_ANALYSES = 8
+_ANALYSIS_SLOTS = threading.BoundedSemaphore(_MAX_ANALYSES)
+_RETRY_AFTER_SECONDS = 10
+
+def _take_slots(count):
+    """Grabs count analysis slots without waiting - all of them or none"""
+    taken = 0
+    while taken < count and _ANALYSIS_SLOTS.acquire(blocking=False):
+        taken += 1
+    if taken < count:
+        for _ in range(taken):
+            _ANALYSIS_SLOTS.release()
+        return False
+    return True
+
+def _server_busy():
+    """The 503 we send back when every analysis slot is taken"""
+    response = jsonify({'error': 'Server is busy analyzing other articles. Please try again shortly.'})
+    response.headers['Retry-After'] = str(_RETRY_AFTER_SECONDS)
+    return response, 503
+
 @app.route('/')
 def index():
     """Show the main page with the analyzer form"""
@@ -21,6 +56,9 @@ def index():
 @app.route('/analyze', methods=['POST'])
 def analyze():
     """Do the actual analysis when someone submits a URL"""
+    if not _ANALYSIS_SLOTS.acquire(blocking=False):
+        return _server_busy()
+    
     try:
         data = request.get_json()
         url = data.get('url')
@@ -28,40 +66,62 @@ def analyze():
         if not url:
             return jsonify({'error': 'URL is required'}), 400
         
-        # Fire up the analyzer
-        analyzer = DocumentationAnalyzer()
+        # Reuse the cached report if the page's ETag hasn't changed.
+        # ?nocache=1 forces a fresh analysis (handy when testing)
+        report = analyze_url(url, use_cache=request.args.get('nocache') != '1')
         
-        if not analyzer.fetch_article(url):
+        if 'error' in report:
             return jsonify({'error': 'Failed to fetch article. Please check the URL.'}), 400
         
-        # Run the full analysis
-        report = analyzer.generate_report()
-        
-        # Calculate some summary stats for the dashboard
-        summary = {
-            'total_suggestions': 0,
-            'high_priority': 0,
-            'sections': {}
-        }
+        if orjson is not None:
+            return Response(orjson.dumps(report), mimetype='application/json')
+        return jsonify(report)
         
-        # Count up suggestions by section
-        for section in ['readability', 'structure', 'completeness', 'style_guidelines']:
-            if section in report and 'suggestions' in report[section]:
-                count = len(report[section]['suggestions'])
-                summary['total_suggestions'] += count
-                summary['sections'][section] = count
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    finally:
+        _ANALYSIS_SLOTS.release()
+
+@app.route('/analyze_batch', methods=['POST'])
+def analyze_batch():
+    """Analyze several URLs in one go - they're fetched side by side, results come back in order"""
+    try:
+        data = request.get_json()
+        urls = data.get('urls')
         
-        # Count high priority items
-        for rec in report.get('overall_recommendations', []):
-            if 'HIGH PRIORITY' in rec:
-                summary['high_priority'] += 1
+        if not urls or not isinstance(urls, list):
+            return jsonify({'error': 'A list of URLs is required'}), 400
+        if len(urls) > _BATCH_LIMIT:
+            return jsonify({'error': f'Too many URLs (max {_BATCH_LIMIT})'}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    
+    # Every worker thread runs its own analysis, so each one needs a slot
+    workers = min(_BATCH_WORKERS, len(urls))
+    if not _take_slots(workers):
+        return _server_busy()
+    
+    try:
+        # Mostly waiting on the network, so threads are plenty. analyze_url
+        # shares the analyzer's pooled session and report cache
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            reports = list(executor.map(analyze_url, urls))
         
-        report['summary'] = summary
+        results = []
+        for url, report in zip(urls, reports):
+            if 'error' in report:
+                report = {'url': url, 'error': 'Failed to fetch article. Please check the URL.'}
+            results.append(report)
         
-        return jsonify(report)
+        if orjson is not None:
+            return Response(orjson.dumps({'results': results}), mimetype='application/json')
+        return jsonify({'results': results})
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
+    finally:
+        for _ in range(workers):
+            _ANALYSIS_SLOTS.release()
 
 @app.route('/health')
 def health():
@@ -74,4 +134,5 @@ if __name__ == '__main__':
     os.makedirs('templates', exist_ok=True)
     os.makedirs('static', exist_ok=True)
     
+    print("This is Flask's dev server - for real traffic run: gunicorn -w 4 --threads 8 -t 60 web_app:app")
     app.run(debug=True, port=5000) 
\ No newline at end of file